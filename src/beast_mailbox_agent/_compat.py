@@ -0,0 +1,9 @@
+"""Helpers smoothing over differences between supported Python versions."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# ``dataclass(slots=True)`` is only available on Python 3.10+.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
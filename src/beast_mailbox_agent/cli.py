@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import signal
-from typing import Callable
+import sys
+from typing import Any, Callable, Coroutine, TypeVar
 
 import typer
 
@@ -13,6 +14,23 @@ from .runtime import AgentRuntime, perform_healthcheck
 
 app = typer.Typer(help="Run and manage the Beast Mailbox Agent.")
 
+# Windows event loops never support add_signal_handler. Non-default POSIX
+# loops may still raise NotImplementedError, which is left to surface.
+_SIGNAL_LOOP_SUPPORTED = sys.platform != "win32"
+_SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+_T = TypeVar("_T")
+
+
+def _run_async(coro: Coroutine[Any, Any, _T]) -> _T:
+    # uvloop ships with the optional ``speedups`` extra (not on Windows).
+    try:
+        import uvloop
+    except ModuleNotFoundError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
 
 def _load_config() -> AgentConfig:
     try:
@@ -22,24 +40,18 @@ def _load_config() -> AgentConfig:
         raise typer.Exit(code=2) from exc
 
 
-def _install_signal_handlers(runtime: AgentRuntime) -> Callable[[], None]:
-    loop = asyncio.get_running_loop()
-
+def _install_signal_handlers(runtime: AgentRuntime, loop: asyncio.AbstractEventLoop) -> Callable[[], None]:
     def _stop(*_: object) -> None:
         runtime.request_shutdown()
 
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        try:
+    if _SIGNAL_LOOP_SUPPORTED:
+        for sig in _SHUTDOWN_SIGNALS:
             loop.add_signal_handler(sig, _stop)
-        except NotImplementedError:
-            pass
 
     def _restore() -> None:
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            try:
+        if _SIGNAL_LOOP_SUPPORTED:
+            for sig in _SHUTDOWN_SIGNALS:
                 loop.remove_signal_handler(sig)
-            except NotImplementedError:
-                pass
 
     return _restore
 
@@ -51,14 +63,14 @@ def run() -> None:
     runtime = AgentRuntime(config=config)
 
     async def _runner() -> None:
-        restore_signals = _install_signal_handlers(runtime)
+        restore_signals = _install_signal_handlers(runtime, asyncio.get_running_loop())
         try:
             await runtime.run()
         finally:
             restore_signals()
 
     try:
-        asyncio.run(_runner())
+        _run_async(_runner())
     except KeyboardInterrupt:  # pragma: no cover - handled by signal handlers
         typer.secho("Shutdown requested", fg=typer.colors.YELLOW)
 
@@ -71,7 +83,7 @@ def healthcheck() -> None:
     async def _runner() -> bool:
         return await perform_healthcheck(config)
 
-    healthy = asyncio.run(_runner())
+    healthy = _run_async(_runner())
     if not healthy:
         typer.secho("Agent is unhealthy", fg=typer.colors.RED)
         raise typer.Exit(code=1)
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import os
+from collections import ChainMap
 from dataclasses import dataclass, field
-from typing import Any, Dict, Mapping, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Type
 from urllib.parse import urlparse
 
 from dotenv import load_dotenv
@@ -12,23 +15,78 @@ from pathlib import Path
 
 from beast_mailbox_core.redis_mailbox import MailboxConfig
 
-# Load secrets from home directory first, then fall back to local lookups.
-load_dotenv(Path.home() / ".env", override=False)
-load_dotenv(override=False)
+_REQUIRED_ENV_KEYS = ("BEAST_AGENT_ID", "BEAST_REDIS_URL", "BEAST_OPENAI_API_KEY")
+_ENV_KEYS = (
+    "BEAST_AGENT_ID",
+    "BEAST_REDIS_URL",
+    "BEAST_OPENAI_API_KEY",
+    "BEAST_STREAM_PREFIX",
+    "BEAST_MAILBOX_STREAM",
+    "BEAST_MAILBOX_GROUP",
+    "BEAST_REPLY_STREAM",
+    "BEAST_LLM_PROVIDER",
+    "BEAST_MODEL_NAME",
+    "BEAST_MAX_TOKENS",
+    "BEAST_TEMPERATURE",
+    "BEAST_CONCURRENCY",
+    "BEAST_RETRY_MAX",
+    "BEAST_RETRY_BACKOFF_BASE",
+    "BEAST_CONTEXT_ENABLED",
+    "BEAST_CONTEXT_TTL",
+    "BEAST_CONTEXT_PREFIX",
+    "BEAST_CONTEXT_REDIS_URL",
+    "BEAST_METRICS_BACKEND",
+    "BEAST_METRICS_PORT",
+    "BEAST_LOG_LEVEL",
+    "BEAST_POLL_INTERVAL",
+    "BEAST_STREAM_MAXLEN",
+    "BEAST_REQUEST_TIMEOUT",
+    "BEAST_RECOVERY_BATCH_SIZE",
+    "BEAST_STREAM_THRESHOLD",
+)
 
 
 class ConfigError(ValueError):
     """Raised when configuration values are invalid or missing."""
 
 
+@lru_cache(maxsize=32)
+def _parse_redis_url(url: str) -> Tuple[str, int, int, Optional[str]]:
+    parsed = urlparse(url)
+    if parsed.scheme not in {"redis", "rediss"}:
+        raise ConfigError("BEAST_REDIS_URL must use redis:// or rediss:// scheme")
+
+    host = parsed.hostname or "localhost"
+    port = parsed.port or 6379
+    try:
+        db = int((parsed.path or "0").lstrip("/") or "0")
+    except ValueError as exc:
+        raise ConfigError("Redis DB component must be numeric") from exc
+    return host, port, db, parsed.password
+
+
+@lru_cache(maxsize=1)
+def _ensure_dotenv_loaded() -> None:
+    # Load secrets from home directory first, then fall back to local lookups.
+    load_dotenv(Path.home() / ".env", override=False)
+    load_dotenv(override=False)
+
+
+@lru_cache(maxsize=4)
+def _from_env_cached(cls: Type["AgentConfig"], values: Tuple[Optional[str], ...]) -> "AgentConfig":
+    return cls._from_values({key: value for key, value in zip(_ENV_KEYS, values) if value is not None})
+
+
 def _as_bool(value: str) -> bool:
     return value.lower() in {"1", "true", "yes", "on"}
 
 
-def _require(value: Optional[str], name: str) -> str:
-    if value is None or value.strip() == "":
-        raise ConfigError(f"{name} is required but was not provided")
-    return value
+def _require(env: Mapping[str, str]) -> None:
+    missing = [key for key in _REQUIRED_ENV_KEYS if not (env.get(key) or "").strip()]
+    if len(missing) == 1:
+        raise ConfigError(f"{missing[0]} is required but was not provided")
+    if missing:
+        raise ConfigError(f"{', '.join(missing)} are required but were not provided")
 
 
 @dataclass(frozen=True)
@@ -59,16 +117,39 @@ class AgentConfig:
     poll_interval: float
     stream_maxlen: int
     request_timeout: float
-    default_options: Dict[str, Any] = field(default_factory=dict)
+    recovery_batch_size: int = 500
+    stream_threshold: Optional[int] = None
+    default_options: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Configs are cached and shared, and default_options is handed to every
+        # PromptRequest, so expose it read-only rather than trusting callers.
+        if not isinstance(self.default_options, MappingProxyType):
+            object.__setattr__(self, "default_options", MappingProxyType(dict(self.default_options)))
 
     @classmethod
     def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "AgentConfig":
-        """Build configuration from environment variables."""
-        env = env or os.environ
+        """Build configuration from environment variables.
 
-        agent_id = _require(env.get("BEAST_AGENT_ID"), "BEAST_AGENT_ID")
-        redis_url = _require(env.get("BEAST_REDIS_URL"), "BEAST_REDIS_URL")
-        openai_api_key = _require(env.get("BEAST_OPENAI_API_KEY"), "BEAST_OPENAI_API_KEY")
+        When reading from the process environment the parsed configuration is
+        memoized against the values of the recognised ``BEAST_*`` variables,
+        so repeated calls return the same instance until one of them changes.
+        Treat the result (including ``default_options``) as immutable.
+        """
+        if not env:
+            _ensure_dotenv_loaded()
+            # Look up only the keys we read: iterating os.environ decodes every
+            # variable in the process, which dominates in large environments.
+            get = os.environ.get
+            return _from_env_cached(cls, tuple(get(key) for key in _ENV_KEYS))
+        return cls._from_values({key: value for key in _ENV_KEYS if (value := env.get(key)) is not None})
+
+    @classmethod
+    def _from_values(cls, env: Mapping[str, str]) -> "AgentConfig":
+        _require(env)
+        agent_id = env["BEAST_AGENT_ID"]
+        redis_url = env["BEAST_REDIS_URL"]
+        openai_api_key = env["BEAST_OPENAI_API_KEY"]
 
         stream_prefix = env.get("BEAST_STREAM_PREFIX", "beast:mailbox")
         mailbox_stream = env.get("BEAST_MAILBOX_STREAM", f"{stream_prefix}:{agent_id}:in")
@@ -94,6 +175,9 @@ class AgentConfig:
             poll_interval = float(env.get("BEAST_POLL_INTERVAL", "1.0"))
             stream_maxlen = int(env.get("BEAST_STREAM_MAXLEN", "1000"))
             request_timeout = float(env.get("BEAST_REQUEST_TIMEOUT", "60.0"))
+            recovery_batch_size = int(env.get("BEAST_RECOVERY_BATCH_SIZE", "500"))
+            stream_threshold_raw = env.get("BEAST_STREAM_THRESHOLD")
+            stream_threshold = int(stream_threshold_raw) if stream_threshold_raw else None
         except ValueError as exc:
             raise ConfigError(f"Invalid numeric configuration: {exc}") from exc
 
@@ -105,6 +189,8 @@ class AgentConfig:
             raise ConfigError("BEAST_MAX_TOKENS must be >= 1")
         if stream_maxlen < 1:
             raise ConfigError("BEAST_STREAM_MAXLEN must be >= 1")
+        if recovery_batch_size < 1:
+            raise ConfigError("BEAST_RECOVERY_BATCH_SIZE must be >= 1")
         if poll_interval <= 0:
             raise ConfigError("BEAST_POLL_INTERVAL must be > 0")
         if retry_backoff_base < 0:
@@ -113,6 +199,8 @@ class AgentConfig:
             raise ConfigError("BEAST_METRICS_BACKEND must be 'logging' or 'prometheus'")
         if metrics_port is not None and metrics_port < 0:
             raise ConfigError("BEAST_METRICS_PORT must be >= 0 when provided")
+        if stream_threshold is not None and stream_threshold < 1:
+            raise ConfigError("BEAST_STREAM_THRESHOLD must be >= 1 when provided")
 
         default_options: Dict[str, Any] = {
             "model": model_name,
@@ -146,35 +234,34 @@ class AgentConfig:
             poll_interval=poll_interval,
             stream_maxlen=stream_maxlen,
             request_timeout=request_timeout,
+            recovery_batch_size=recovery_batch_size,
+            stream_threshold=stream_threshold,
             default_options=default_options,
         )
 
     def to_mailbox_config(self) -> MailboxConfig:
         """Translate agent configuration to MailboxConfig used by core library."""
-        parsed = urlparse(self.redis_url)
-        if parsed.scheme not in {"redis", "rediss"}:
-            raise ConfigError("BEAST_REDIS_URL must use redis:// or rediss:// scheme")
-
-        host = parsed.hostname or "localhost"
-        port = parsed.port or 6379
-        try:
-            db = int((parsed.path or "0").lstrip("/") or "0")
-        except ValueError as exc:
-            raise ConfigError("Redis DB component must be numeric") from exc
-
+        host, port, db, password = _parse_redis_url(self.redis_url)
         return MailboxConfig(
             host=host,
             port=port,
             db=db,
-            password=parsed.password,
+            password=password,
             stream_prefix=self.stream_prefix,
             max_stream_length=self.stream_maxlen,
             poll_interval=self.poll_interval,
         )
 
-    def merged_options(self, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Return default provider options combined with overrides from a prompt."""
-        merged = dict(self.default_options)
-        if overrides:
-            merged.update({k: v for k, v in overrides.items() if v is not None})
-        return merged
+    def merged_options(self, overrides: Optional[Mapping[str, Any]] = None) -> Mapping[str, Any]:
+        """Return default provider options combined with overrides from a prompt.
+
+        Without overrides this is the read-only ``default_options`` itself;
+        otherwise the overrides are layered over the defaults with a read-only
+        ``ChainMap`` view rather than copying them.
+        """
+        if not overrides:
+            return self.default_options
+        filtered = {k: v for k, v in overrides.items() if v is not None}
+        if not filtered:
+            return self.default_options
+        return MappingProxyType(ChainMap(filtered, self.default_options))
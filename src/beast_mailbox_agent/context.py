@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
-import json
-from typing import Dict, Optional, Protocol
+import asyncio
+import logging
+from collections import OrderedDict
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, List, Optional, Protocol, Set, Tuple
 
-from redis.asyncio import Redis as AsyncRedis, from_url as redis_from_url
+try:  # orjson is an optional speedup; stdlib json produces the same documents.
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ModuleNotFoundError:  # pragma: no cover - depends on installed extras
+    from json import dumps as _json_dumps, loads as _json_loads
+
+LOGGER = logging.getLogger("beast_mailbox_agent.context")
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from redis.asyncio import Redis as AsyncRedis
 
 
 class ContextStore(Protocol):
@@ -34,24 +45,58 @@ class NullContextStore(ContextStore):
         return None
 
 
+# NullContextStore is stateless, so one shared instance serves every handler.
+NULL_CONTEXT_STORE = NullContextStore()
+
+
 class InMemoryContextStore(ContextStore):
-    """Simple in-memory store primarily for testing or local runs."""
+    """Simple in-memory store primarily for testing or local runs.
+
+    With ``maxsize`` set, only that many threads are kept and the least
+    recently used one is evicted first; by default the store is unbounded.
+    """
 
-    def __init__(self) -> None:
-        self._storage: Dict[str, Dict] = {}
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        self._storage: OrderedDict[str, Dict] = OrderedDict()
+        self._maxsize = maxsize
 
     async def get(self, key: str) -> Optional[Dict]:
-        return self._storage.get(key)
+        value = self._storage.get(key)
+        if value is not None and self._maxsize is not None:
+            self._storage.move_to_end(key)
+        return value
 
     async def set(self, key: str, value: Dict, ttl: Optional[int] = None) -> None:
-        self._storage[key] = value
+        storage = self._storage
+        storage[key] = value
+        if self._maxsize is not None:
+            storage.move_to_end(key)
+            while len(storage) > self._maxsize:
+                storage.popitem(last=False)
 
     async def clear(self, key: str) -> None:
         self._storage.pop(key, None)
 
 
 class RedisContextStore(ContextStore):
-    """Redis-backed context store for persistent conversation history."""
+    """Redis-backed context store for persistent conversation history.
+
+    Setting ``local_maxsize`` enables a small in-process LRU of recently used
+    entries (disabled by default, so every read goes to Redis). Reads within
+    ``local_ttl`` seconds of the last fetch or write are served locally. Entries
+    up to ``local_max_stale`` seconds old are still returned immediately while
+    a background refresh pulls the current value from Redis
+    (stale-while-revalidate); anything older is read through. The cache holds
+    encoded documents, so each read returns a fresh copy.
+
+    By default every ``set`` is written before it returns. A positive
+    ``write_delay`` buffers writes for that many seconds and sends them as one
+    pipeline, so a burst of updates costs a single round-trip and repeated
+    writes to the same key collapse to the last value. Writes from a failed
+    flush stay buffered for the next one; an unbuffered ``set`` that raises
+    stored nothing. Call ``flush()`` (or ``aclose()``)
+    to push buffered writes immediately.
+    """
 
     def __init__(
         self,
@@ -59,15 +104,31 @@ class RedisContextStore(ContextStore):
         url: Optional[str] = None,
         prefix: str,
         redis_client: Optional[AsyncRedis] = None,
+        local_ttl: float = 1.0,
+        local_max_stale: float = 5.0,
+        local_maxsize: int = 0,
+        write_delay: float = 0.0,
     ) -> None:
         if redis_client is None and url is None:
             raise ValueError("RedisContextStore requires either a redis_client or url")
         self._url = url
         self._client: Optional[AsyncRedis] = redis_client
         self._prefix = prefix.rstrip(":")
+        self._local_ttl = local_ttl
+        self._local_max_stale = max(local_max_stale, local_ttl)
+        self._local_maxsize = local_maxsize
+        self._lru: OrderedDict[str, Tuple[bytes | str, float]] = OrderedDict()
+        self._refreshing: Dict[str, asyncio.Task[None]] = {}
+        self._write_delay = write_delay
+        self._pending: Dict[str, Tuple[bytes | str, Optional[int]]] = {}
+        self._flushing: List[Dict[str, Tuple[bytes | str, Optional[int]]]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set[asyncio.Task[None]] = set()
 
     async def _client_or_create(self) -> AsyncRedis:
         if self._client is None:
+            from redis.asyncio import from_url as redis_from_url
+
             assert self._url is not None
             self._client = redis_from_url(self._url, decode_responses=False)
         return self._client
@@ -76,22 +137,120 @@ class RedisContextStore(ContextStore):
         return f"{self._prefix}:{key}"
 
     async def get(self, key: str) -> Optional[Dict]:
-        client = await self._client_or_create()
-        value = await client.get(self._key(key))
-        if not value:
+        pending = self._pending.get(key)
+        if pending is not None:
+            return _json_loads(pending[0])
+        entry = self._lru.get(key)
+        if entry is not None:
+            dump, fetched_at = entry
+            age = monotonic() - fetched_at
+            if age < self._local_max_stale:
+                self._lru.move_to_end(key)
+                if age >= self._local_ttl and key not in self._refreshing:
+                    self._refreshing[key] = asyncio.create_task(self._refresh(key, entry))
+                return _json_loads(dump)
+        dump = await self._fetch(key)
+        if dump is None:
+            self._lru.pop(key, None)
             return None
-        if isinstance(value, bytes):
-            value = value.decode()
-        return json.loads(value)
+        self._remember(key, dump)
+        return _json_loads(dump)
 
     async def set(self, key: str, value: Dict, ttl: Optional[int] = None) -> None:
-        client = await self._client_or_create()
-        dump = json.dumps(value)
-        if ttl and ttl > 0:
-            await client.set(self._key(key), dump, ex=ttl)
-        else:
-            await client.set(self._key(key), dump)
+        dump = _json_dumps(value)
+        ex = ttl if ttl and ttl > 0 else None
+        self._remember(key, dump)
+        if self._write_delay <= 0:
+            # Unbuffered writes go straight to Redis; a failure means the value
+            # was not stored, so nothing is kept around to be written later.
+            try:
+                client = await self._client_or_create()
+                await client.set(self._key(key), dump, ex=ex)
+            except BaseException:
+                self._lru.pop(key, None)
+                raise
+            return
+        self._pending[key] = (dump, ex)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._write_delay, self._schedule_flush)
 
     async def clear(self, key: str) -> None:
+        self._lru.pop(key, None)
+        self._pending.pop(key, None)
+        for batch in self._flushing:
+            batch.pop(key, None)
         client = await self._client_or_create()
         await client.delete(self._key(key))
+
+    async def flush(self) -> None:
+        """Write any buffered updates to Redis in a single pipeline."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self._flushing.append(pending)
+        try:
+            client = await self._client_or_create()
+            async with client.pipeline(transaction=False) as pipe:
+                for key, (dump, ttl) in pending.items():
+                    pipe.set(self._key(key), dump, ex=ttl)
+                await pipe.execute()
+        except BaseException:
+            # Keep unwritten updates for the next flush unless a newer set or
+            # a clear() superseded them, and stop serving them as confirmed.
+            for key, item in pending.items():
+                self._pending.setdefault(key, item)
+                self._lru.pop(key, None)
+            raise
+        finally:
+            self._flushing.remove(pending)
+
+    async def aclose(self) -> None:
+        """Flush buffered writes and close the client if this store created it."""
+        await self.flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        if self._url is not None and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _schedule_flush(self) -> None:
+        self._flush_handle = None
+        task = asyncio.ensure_future(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task[None]) -> None:
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            LOGGER.warning("Failed to persist buffered context updates: %s", task.exception())
+
+    async def _fetch(self, key: str) -> Optional[bytes]:
+        client = await self._client_or_create()
+        value = await client.get(self._key(key))
+        return value or None
+
+    async def _refresh(self, key: str, entry: Tuple[bytes | str, float]) -> None:
+        try:
+            dump = await self._fetch(key)
+        except Exception:  # pragma: no cover - a failed refresh keeps serving the stale value
+            return
+        finally:
+            self._refreshing.pop(key, None)
+        # A write or clear that landed while we were fetching is newer than what we read.
+        if self._lru.get(key) is not entry:
+            return
+        if dump is None:
+            self._lru.pop(key, None)
+        else:
+            self._remember(key, dump)
+
+    def _remember(self, key: str, dump: bytes | str) -> None:
+        if self._local_maxsize <= 0:
+            return
+        self._lru[key] = (dump, monotonic())
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._local_maxsize:
+            self._lru.popitem(last=False)
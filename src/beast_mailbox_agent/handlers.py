@@ -4,18 +4,59 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from time import perf_counter
-from typing import Any, Awaitable, Callable, Dict, Optional
+from collections import deque
+from random import random
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
 
 from beast_mailbox_core import MailboxMessage
 
 from .config import AgentConfig
-from .context import ContextStore, NullContextStore
+from .context import NULL_CONTEXT_STORE, ContextStore, NullContextStore
 from .metrics import LoggingMetricsCollector, MetricsCollector, MetricsEvent
 from .providers.base import ProviderError, ProviderResponse, PromptRequest
 
 SendResponseFn = Callable[..., Awaitable[str]]
 
+_Extracted = Tuple[
+    Any,
+    Optional[Dict[str, Any]],
+    Dict[str, Any],
+    Any,
+    Any,
+    Optional[Dict[str, Any]],
+    bool,
+]
+
+
+# Upper bound on a single retry delay (jitter included), and the fraction of
+# the delay added as random jitter so messages retrying the same outage do not
+# fire in lockstep.
+_BACKOFF_CAP = 30.0
+_BACKOFF_JITTER = 0.1
+
+
+def _extract(payload: Dict[str, Any]) -> _Extracted:
+    """Read and type-check every field the handler uses from a prompt payload.
+
+    Returns ``(prompt, options, metadata, thread_id, reply_to, context, valid)``.
+    Payloads arrive as decoded JSON, so exact ``type() is`` checks suffice.
+    """
+    get = payload.get
+    prompt = get("prompt")
+    options = get("options")
+    metadata = get("metadata")
+    context = get("context")
+    return (
+        prompt,
+        options if type(options) is dict else None,
+        metadata if type(metadata) is dict else {},
+        get("thread_id"),
+        get("reply_to"),
+        context if type(context) is dict else None,
+        type(prompt) is str and prompt.strip() != "",
+    )
+
 
 class PromptHandler:
     """Coordinate prompt validation, provider invocation, and response emission."""
@@ -35,41 +76,99 @@ class PromptHandler:
         self._config = config
         self._provider = provider
         self._send_response = send_response
-        self._context_store = context_store or NullContextStore()
+        self._context_store = context_store or NULL_CONTEXT_STORE
         self._logger = logger or logging.getLogger("beast_mailbox_agent.prompt_handler")
-        self._semaphore = asyncio.Semaphore(config.concurrency)
         self._metrics = metrics or LoggingMetricsCollector()
+        # Bound once here; these are called several times per message.
+        self._provider_generate = provider.generate
+        self._log_debug = self._logger.debug
+        self._log_warning = self._logger.warning
+        self._metrics_record = self._metrics.record
+        self._context_key_prefix = f"{config.agent_id}:"
+        # A NullContextStore never returns anything, so skip the awaits entirely.
+        self._context_active = config.context_enabled and not isinstance(self._context_store, NullContextStore)
+        # Delay before retry N is _backoff_delays[N - 1]; retries stop at retry_max.
+        self._backoff_delays = tuple(
+            min(_BACKOFF_CAP, config.retry_backoff_base * (1 << i)) for i in range(config.retry_max)
+        )
+        # Provider admission is an explicit counter rather than a Semaphore so
+        # set_concurrency() can resize it while messages are in flight.
+        self._slot_limit = config.concurrency
+        self._slots_active = 0
+        self._slot_waiters: Deque[asyncio.Future[None]] = deque()
 
     async def handle(self, message: MailboxMessage) -> None:
-        """Entry point used by the mailbox processor."""
-        async with self._semaphore:
-            try:
-                await self._process_message(message)
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:  # pragma: no cover - defensive logging
-                self._logger.exception("Unhandled error processing mailbox message %s: %s", message.message_id, exc)
+        """Entry point used by the mailbox processor.
+
+        At most ``config.concurrency`` messages call the provider at a time; a
+        message backing off before a retry gives up its provider slot so other
+        messages can proceed.
+        """
+        try:
+            await self._process_message(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive logging
+            self._logger.exception("Unhandled error processing mailbox message %s: %s", message.message_id, exc)
+
+    def set_concurrency(self, concurrency: int) -> None:
+        """Change how many provider calls may run at once, without a restart.
+
+        Raising the limit admits waiting messages immediately; lowering it lets
+        calls already in flight finish and admits nothing new until the count
+        drops below the new limit.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._slot_limit = concurrency
+        self._grant_slots()
+
+    async def _acquire_slot(self) -> None:
+        if self._slots_active < self._slot_limit and not self._slot_waiters:
+            self._slots_active += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._slot_waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # A slot granted just before the cancellation belongs to us; pass it on.
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()
+            raise
+
+    def _release_slot(self) -> None:
+        self._slots_active -= 1
+        self._grant_slots()
+
+    def _grant_slots(self) -> None:
+        waiters = self._slot_waiters
+        while waiters and self._slots_active < self._slot_limit:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                self._slots_active += 1
+                waiter.set_result(None)
 
     async def _process_message(self, message: MailboxMessage) -> None:
-        start = perf_counter()
-        payload = message.payload or {}
-        prompt_value = payload.get("prompt")
-        if not isinstance(prompt_value, str) or prompt_value.strip() == "":
+        start = perf_counter_ns()
+        config = self._config
+        prompt_value, options, metadata, thread_id, reply_to, context, valid = _extract(message.payload or {})
+        if not valid:
             await self._send_error(
                 message,
                 code="invalid_payload",
                 error_message="Payload must include non-empty 'prompt' field",
                 retryable=False,
-                metadata=payload.get("metadata"),
+                metadata=metadata,
             )
-            self._metrics.record(
+            self._metrics_record(
                 MetricsEvent(
-                    agent_id=self._config.agent_id,
+                    agent_id=config.agent_id,
                     message_id=message.message_id,
                     sender=message.sender,
                     status="error",
                     provider=None,
-                    duration_ms=(perf_counter() - start) * 1000,
+                    duration_ms=(perf_counter_ns() - start) / 1_000_000,
                     attempts=0,
                     retryable=False,
                     error_code="invalid_payload",
@@ -77,15 +176,11 @@ class PromptHandler:
             )
             return
 
-        options = payload.get("options")
-        merged_options = self._config.merged_options(options if isinstance(options, dict) else None)
-        metadata = payload.get("metadata") if isinstance(payload.get("metadata"), dict) else {}
-        thread_id = payload.get("thread_id")
-        reply_to = payload.get("reply_to") or message.sender
-
-        context = payload.get("context") if isinstance(payload.get("context"), dict) else None
-        if self._config.context_enabled and thread_id:
-            stored = await self._context_store.get(self._context_key(thread_id))
+        merged_options = config.merged_options(options)
+        reply_to = reply_to or message.sender
+        context_key = self._context_key(thread_id) if self._context_active and thread_id else None
+        if context_key is not None:
+            stored = await self._context_store.get(context_key)
             if stored:
                 context = stored
 
@@ -110,14 +205,14 @@ class PromptHandler:
                 metadata=metadata,
                 details=error.details,
             )
-            self._metrics.record(
+            self._metrics_record(
                 MetricsEvent(
-                    agent_id=self._config.agent_id,
+                    agent_id=config.agent_id,
                     message_id=message.message_id,
                     sender=message.sender,
                     status="error",
                     provider=None,
-                    duration_ms=(perf_counter() - start) * 1000,
+                    duration_ms=(perf_counter_ns() - start) / 1_000_000,
                     attempts=attempts,
                     retryable=error.retryable,
                     error_code=error.code,
@@ -127,20 +222,20 @@ class PromptHandler:
 
         provider_response: ProviderResponse = outcome  # type: ignore[assignment]
         await self._send_success(message, provider_response, reply_to, metadata, thread_id)
-        self._metrics.record(
+        self._metrics_record(
             MetricsEvent(
-                agent_id=self._config.agent_id,
+                agent_id=config.agent_id,
                 message_id=message.message_id,
                 sender=message.sender,
                 status="success",
                 provider=provider_response.provider,
-                duration_ms=(perf_counter() - start) * 1000,
+                duration_ms=(perf_counter_ns() - start) / 1_000_000,
                 attempts=attempts,
             )
         )
 
-        if self._config.context_enabled and thread_id:
-            await self._update_context(thread_id, context, prompt_value, provider_response.content)
+        if context_key is not None:
+            await self._update_context(context_key, context, prompt_value, provider_response.content)
 
     async def _invoke_provider_with_retry(
         self,
@@ -151,15 +246,19 @@ class PromptHandler:
         while True:
             attempt += 1
             try:
-                self._logger.debug(
+                self._log_debug(
                     "Processing prompt message %s attempt %s",
                     message.message_id,
                     attempt,
                 )
-                response = await self._provider.generate(request)
+                await self._acquire_slot()
+                try:
+                    response = await self._provider_generate(request)
+                finally:
+                    self._release_slot()
                 return True, response, attempt
             except ProviderError as exc:
-                self._logger.warning(
+                self._log_warning(
                     "Provider error for message %s: %s (retryable=%s, attempt=%s/%s)",
                     message.message_id,
                     exc.code,
@@ -182,9 +281,9 @@ class PromptHandler:
                 ), attempt
 
     async def _backoff(self, attempt: int) -> None:
-        delay = self._config.retry_backoff_base * (2 ** (attempt - 1))
-        if delay > 0:
-            await asyncio.sleep(delay)
+        delay = self._backoff_delays[attempt - 1]
+        if delay:
+            await asyncio.sleep(min(_BACKOFF_CAP, delay * (1 + _BACKOFF_JITTER * random())))
 
     async def _send_success(
         self,
@@ -248,12 +347,11 @@ class PromptHandler:
 
     async def _update_context(
         self,
-        thread_id: str,
+        key: str,
         context: Optional[Dict[str, Any]],
         prompt: str,
         response_text: str,
     ) -> None:
-        key = self._context_key(thread_id)
         context = context or {"messages": []}
         messages = context.setdefault("messages", [])
         if isinstance(messages, list):
@@ -261,5 +359,5 @@ class PromptHandler:
             messages.append({"role": "assistant", "content": response_text})
         await self._context_store.set(key, context, ttl=self._config.context_ttl)
 
-    def _context_key(self, thread_id: str) -> str:
-        return f"{self._config.agent_id}:{thread_id}"
+    def _context_key(self, thread_id: Any) -> str:
+        return self._context_key_prefix + str(thread_id)
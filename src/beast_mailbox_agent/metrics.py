@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Optional, Protocol
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Protocol
 
-from prometheus_client import CollectorRegistry, Counter, Histogram, start_http_server
+from ._compat import DATACLASS_SLOTS
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from prometheus_client import CollectorRegistry
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MetricsEvent:
     """Structured metrics payload."""
 
@@ -38,6 +42,9 @@ class LoggingMetricsCollector(MetricsCollector):
         self._logger = logger or logging.getLogger("beast_mailbox_agent.metrics")
 
     def record(self, event: MetricsEvent) -> None:
+        logger = self._logger
+        if not logger.isEnabledFor(logging.INFO):
+            return
         payload = {
             "agent_id": event.agent_id,
             "message_id": event.message_id,
@@ -49,7 +56,15 @@ class LoggingMetricsCollector(MetricsCollector):
             "retryable": event.retryable,
             "error_code": event.error_code,
         }
-        self._logger.info("prompt_metrics", extra={"metrics": payload})
+        logger.info(
+            "prompt_metrics agent=%s msg=%s status=%s dur=%.3f attempts=%d",
+            event.agent_id,
+            event.message_id,
+            event.status,
+            event.duration_ms,
+            event.attempts,
+            extra={"metrics": payload},
+        )
 
 
 class PrometheusMetricsCollector(MetricsCollector):
@@ -62,6 +77,8 @@ class PrometheusMetricsCollector(MetricsCollector):
         port: Optional[int] = None,
         registry: Optional[CollectorRegistry] = None,
     ) -> None:
+        from prometheus_client import CollectorRegistry, Counter, Histogram, start_http_server
+
         self._agent_id = agent_id
         self._registry = registry or CollectorRegistry()
         self._events = Counter(
@@ -83,6 +100,11 @@ class PrometheusMetricsCollector(MetricsCollector):
             registry=self._registry,
             buckets=(1, 2, 3, 4, 5, 10),
         )
+        # Label sets repeat almost every event; cache the bound children so
+        # record() skips prometheus_client's per-call label resolution.
+        self._event_child = lru_cache(maxsize=64)(self._bind_event)
+        self._duration_child = lru_cache(maxsize=64)(self._bind_duration)
+        self._attempts_child = lru_cache(maxsize=64)(self._bind_attempts)
         if port is not None:
             start_http_server(port, registry=self._registry)
 
@@ -99,19 +121,16 @@ class PrometheusMetricsCollector(MetricsCollector):
         )
         error_code = event.error_code or "none"
 
-        self._events.labels(
-            agent_id=event.agent_id,
-            status=event.status,
-            provider=provider,
-            retryable=retryable,
-            error_code=error_code,
-        ).inc()
-        self._duration.labels(
-            agent_id=event.agent_id,
-            status=event.status,
-            provider=provider,
-        ).observe(max(event.duration_ms / 1000.0, 0.0))
-        self._attempts.labels(
-            agent_id=event.agent_id,
-            status=event.status,
-        ).observe(max(float(event.attempts), 0.0))
+        self._event_child(event.agent_id, event.status, provider, retryable, error_code).inc()
+        self._duration_child(event.agent_id, event.status, provider).observe(max(event.duration_ms / 1000.0, 0.0))
+        self._attempts_child(event.agent_id, event.status).observe(max(float(event.attempts), 0.0))
+
+    def _bind_event(self, agent_id: str, status: str, provider: str, retryable: str, error_code: str):
+        # Positional values follow the label order declared in __init__.
+        return self._events.labels(agent_id, status, provider, retryable, error_code)
+
+    def _bind_duration(self, agent_id: str, status: str, provider: str):
+        return self._duration.labels(agent_id, status, provider)
+
+    def _bind_attempts(self, agent_id: str, status: str):
+        return self._attempts.labels(agent_id, status)
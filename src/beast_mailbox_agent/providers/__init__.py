@@ -1,7 +1,8 @@
 """Provider registry exports."""
 
+from typing import Any
+
 from .base import BaseProvider, ProviderError, ProviderResponse, PromptRequest
-from .openai import OpenAIChatProvider
 
 __all__ = [
     "BaseProvider",
@@ -10,3 +11,12 @@ __all__ = [
     "PromptRequest",
     "OpenAIChatProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Provider adapters pull in their SDKs; import them only when first used.
+    if name == "OpenAIChatProvider":
+        from .openai import OpenAIChatProvider
+
+        return OpenAIChatProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Dict, Mapping, Optional, Protocol
 
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PromptRequest:
     """Normalized prompt request passed to provider adapters."""
 
     prompt: str
-    options: Dict[str, Any]
+    options: Mapping[str, Any]
     metadata: Dict[str, Any]
     context: Optional[Dict[str, Any]] = None
     thread_id: Optional[str] = None
@@ -19,7 +21,7 @@ class PromptRequest:
     message_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProviderResponse:
     """Structured provider output used by the agent."""
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
 
+import httpx
 from openai import (
     APIConnectionError,
     APIError,
@@ -16,23 +18,49 @@ from .base import BaseProvider, ProviderError, ProviderResponse, PromptRequest
 
 
 def _build_messages(prompt: str, context: Optional[Dict[str, Any]]) -> List[Dict[str, str]]:
-    messages: List[Dict[str, str]] = []
-    if context:
-        context_messages = context.get("messages")
-        if isinstance(context_messages, list):
-            for item in context_messages:
-                if isinstance(item, dict) and "role" in item and "content" in item:
-                    messages.append({"role": str(item["role"]), "content": str(item["content"])})
+    context_messages = context.get("messages") if context else None
+    if not isinstance(context_messages, list):
+        return [{"role": "user", "content": prompt}]
+    messages = [
+        {"role": str(item["role"]), "content": str(item["content"])}
+        for item in context_messages
+        if isinstance(item, dict) and "role" in item and "content" in item
+    ]
     messages.append({"role": "user", "content": prompt})
     return messages
 
 
+_RETRYABLE_EXCEPTIONS: Tuple[Type[BaseException], ...] = (RateLimitError, APIConnectionError, APITimeoutError)
+
+
 def _is_retryable(exc: BaseException) -> bool:
-    return isinstance(exc, (RateLimitError, APIConnectionError, APITimeoutError))
+    return isinstance(exc, _RETRYABLE_EXCEPTIONS)
+
+
+def _usage_dict(raw_usage: Any) -> Dict[str, Any]:
+    if not raw_usage:
+        return {}
+    return {
+        "prompt_tokens": raw_usage.prompt_tokens,
+        "completion_tokens": raw_usage.completion_tokens,
+        "total_tokens": raw_usage.total_tokens,
+    }
 
 
 class OpenAIChatProvider(BaseProvider):
-    """Adapter for OpenAI Chat Completions API."""
+    """Adapter for OpenAI Chat Completions API.
+
+    Requests whose ``max_tokens`` reaches ``stream_threshold`` are streamed and
+    the deltas joined once complete, so long completions keep the connection
+    active instead of idling until the whole reply is ready. Streaming is off
+    when ``stream_threshold`` is ``None`` (the default); a prompt can also ask
+    for it, or opt out, with a ``stream`` option.
+
+    ``http_client`` supplies a preconfigured ``httpx.AsyncClient`` (connection
+    limits, proxies or a mock transport) in place of the SDK default; the
+    caller owns it and ``aclose()`` leaves it open. The SDK client is re-created
+    on the next request after ``aclose()``, so a stopped runtime can restart.
+    """
 
     def __init__(
         self,
@@ -41,25 +69,55 @@ class OpenAIChatProvider(BaseProvider):
         *,
         timeout: float,
         default_options: Optional[Dict[str, Any]] = None,
+        stream_threshold: Optional[int] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
-        self._client = AsyncOpenAI(api_key=api_key, timeout=timeout)
-        self._default_model = default_model
-        self._default_options = default_options or {}
+        # Split model and timeout out of the defaults once so requests without
+        # overrides can pass the remaining options straight through.
+        options = dict(default_options or {})
+        self._default_model = options.pop("model", default_model)
+        self._default_timeout = options.pop("timeout", timeout)
+        self._api_key = api_key
+        self._http_client = http_client
+        self._client: Optional[AsyncOpenAI] = None
+        self._default_options: Dict[str, Any] = options
+        self._stream_threshold = stream_threshold
+        # with_options() builds a new client wrapper each call; keep one per
+        # distinct per-request timeout (they share the underlying HTTP pool).
+        self._client_with_timeout = lru_cache(maxsize=8)(self._bind_timeout)
 
     async def generate(self, request: PromptRequest) -> ProviderResponse:
-        options = dict(self._default_options)
-        options.update(request.options or {})
-        model = options.pop("model", self._default_model)
-
         client = self._client
-        timeout = options.pop("timeout", None)
-        if timeout is not None:
-            client = client.with_options(timeout=timeout)
-
+        if client is None:
+            client = self._open_client()
+        stream_requested = None
+        if request.options:
+            options = {**self._default_options, **request.options}
+            model = options.pop("model", self._default_model)
+            # Streaming changes the response type, so it is never passed through
+            # as a raw option; the streamed path sets its own stream_options.
+            stream_requested = options.pop("stream", None)
+            options.pop("stream_options", None)
+            timeout = options.pop("timeout", None)
+            # The runtime passes the configured timeout on every request; only
+            # clone the client when a prompt actually asks for a different one.
+            if timeout is not None and timeout != self._default_timeout:
+                client = self._client_with_timeout(timeout)
+        else:
+            options = self._default_options
+            model = self._default_model
+
+        messages = _build_messages(request.prompt, request.context)
+        if stream_requested is not None:
+            stream = bool(stream_requested)
+        else:
+            stream = self._stream_threshold is not None and (options.get("max_tokens") or 0) >= self._stream_threshold
         try:
+            if stream:
+                return await self._generate_streamed(client, model, messages, options)
             response = await client.chat.completions.create(
                 model=model,
-                messages=_build_messages(request.prompt, request.context),
+                messages=messages,
                 **options,
             )
         except APIError as exc:
@@ -78,21 +136,67 @@ class OpenAIChatProvider(BaseProvider):
 
         choice = response.choices[0]
         content = getattr(choice.message, "content", "") or ""
-        usage = {}
-        if response.usage:
-            usage = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
-            }
-
         return ProviderResponse(
             content=content,
             model=response.model,
             request_id=response.id,
-            usage=usage,
+            usage=_usage_dict(response.usage),
             provider="openai",
         )
 
+    async def _generate_streamed(
+        self,
+        client: AsyncOpenAI,
+        model: str,
+        messages: List[Dict[str, str]],
+        options: Mapping[str, Any],
+    ) -> ProviderResponse:
+        chunks = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            stream=True,
+            stream_options={"include_usage": True},
+            **options,
+        )
+        parts: List[str] = []
+        append = parts.append
+        response_model = model
+        request_id = ""
+        raw_usage = None
+        async for chunk in chunks:
+            response_model = chunk.model or response_model
+            request_id = chunk.id or request_id
+            # With include_usage the final chunk carries usage and no choices.
+            if chunk.usage:
+                raw_usage = chunk.usage
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    append(delta)
+        return ProviderResponse(
+            content="".join(parts),
+            model=response_model,
+            request_id=request_id,
+            usage=_usage_dict(raw_usage),
+            provider="openai",
+        )
+
+    def _open_client(self) -> AsyncOpenAI:
+        client = self._client = AsyncOpenAI(
+            api_key=self._api_key,
+            timeout=self._default_timeout,
+            http_client=self._http_client,
+        )
+        return client
+
+    def _bind_timeout(self, timeout: float) -> AsyncOpenAI:
+        client = self._client
+        if client is None:
+            client = self._open_client()
+        return client.with_options(timeout=timeout)
+
     async def aclose(self) -> None:
-        self._client.close()
+        self._client_with_timeout.cache_clear()
+        client, self._client = self._client, None
+        if client is not None and self._http_client is None:
+            await client.close()
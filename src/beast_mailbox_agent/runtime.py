@@ -4,32 +4,69 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Awaitable, Callable, Optional
+from typing import Awaitable, Callable, Dict, Optional, Union
 
 from beast_mailbox_core import MailboxMessage
 from beast_mailbox_core.redis_mailbox import RedisMailboxService
+from redis.asyncio import BlockingConnectionPool, Redis as AsyncRedis
 from redis.exceptions import ResponseError
 
 from .config import AgentConfig, ConfigError
-from .context import ContextStore, NullContextStore, RedisContextStore
+from .context import NULL_CONTEXT_STORE, ContextStore, RedisContextStore
 from .handlers import PromptHandler
-from .metrics import LoggingMetricsCollector, PrometheusMetricsCollector
+from .metrics import LoggingMetricsCollector, MetricsCollector, PrometheusMetricsCollector
 from .providers.base import BaseProvider
-from .providers.openai import OpenAIChatProvider
 
 LOGGER = logging.getLogger("beast_mailbox_agent.runtime")
 
 
+_LEVELS = {
+    "NOTSET": logging.NOTSET,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "FATAL": logging.CRITICAL,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
 def _level_for(name: str) -> int:
-    level = getattr(logging, name.upper(), logging.INFO)
-    if isinstance(level, int):
-        return level
-    return logging.INFO
+    return _LEVELS.get(name.upper(), logging.INFO)
+
+
+def _stream_id(value: Union[bytes, str]) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+# Metrics backends selectable via BEAST_METRICS_BACKEND; config validation
+# restricts the value to these keys.
+_METRICS_BACKENDS: Dict[str, Callable[[AgentConfig], MetricsCollector]] = {
+    "logging": lambda config: LoggingMetricsCollector(),
+    "prometheus": lambda config: PrometheusMetricsCollector(
+        agent_id=config.agent_id,
+        port=config.metrics_port,
+    ),
+}
+
+
+def _create_redis_pool(config: AgentConfig) -> BlockingConnectionPool:
+    # Each worker holds at most one connection at a time (reply or context
+    # write); the extra two cover the consumer's blocking XREADGROUP and
+    # pending recovery. Blocking rather than failing when exhausted.
+    return BlockingConnectionPool.from_url(
+        config.redis_url,
+        max_connections=config.concurrency * 2 + 2,
+        decode_responses=False,
+    )
 
 
 def create_provider(config: AgentConfig) -> BaseProvider:
     """Instantiate provider adapter specified in configuration."""
     if config.llm_provider.lower() == "openai":
+        from .providers.openai import OpenAIChatProvider
+
         return OpenAIChatProvider(
             api_key=config.openai_api_key,
             default_model=config.model_name,
@@ -38,6 +75,7 @@ def create_provider(config: AgentConfig) -> BaseProvider:
                 "max_tokens": config.max_tokens,
                 "temperature": config.temperature,
             },
+            stream_threshold=config.stream_threshold,
         )
     raise ConfigError(f"Unsupported LLM provider: {config.llm_provider}")
 
@@ -57,20 +95,30 @@ class AgentRuntime:
         self.config = config
         LOGGER.setLevel(_level_for(config.log_level))
 
-        self.mailbox_service = mailbox_service or RedisMailboxService(
-            config.agent_id,
-            config.to_mailbox_config(),
-        )
+        # When the runtime builds its own Redis clients, mailbox consumption,
+        # pending recovery and the context store share one connection pool.
+        self._redis_pool: Optional[BlockingConnectionPool] = None
+        if mailbox_service is None:
+            self._redis_pool = _create_redis_pool(config)
+            mailbox_service = RedisMailboxService(config.agent_id, config.to_mailbox_config())
+        self.mailbox_service = mailbox_service
+        self._attach_shared_client()
 
         if context_store is None:
-            if config.context_enabled:
+            if not config.context_enabled:
+                context_store = NULL_CONTEXT_STORE
+            elif self._redis_pool is not None and config.context_redis_url == config.redis_url:
                 context_store = RedisContextStore(
-                    url=config.context_redis_url,
+                    redis_client=AsyncRedis(connection_pool=self._redis_pool),
                     prefix=config.context_prefix,
                 )
             else:
-                context_store = NullContextStore()
+                context_store = RedisContextStore(
+                    url=config.context_redis_url,
+                    prefix=config.context_prefix,
+                )
 
+        self._context_store = context_store
         self._provider = provider
         self._metrics_collector = self._create_metrics_collector(config)
 
@@ -84,16 +132,16 @@ class AgentRuntime:
                 context_store=context_store,
                 metrics=self._metrics_collector,
             )
-        else:
-            if self._provider is None and hasattr(prompt_handler, "_provider"):
-                self._provider = getattr(prompt_handler, "_provider")
+        elif self._provider is None:
+            self._provider = getattr(prompt_handler, "_provider", None)
 
         self._prompt_handler = prompt_handler
-        if hasattr(prompt_handler, "handle"):
-            self._prompt_callback: Callable[[MailboxMessage], Awaitable[None]] = prompt_handler.handle  # type: ignore[attr-defined]
-        else:
-            self._prompt_callback = prompt_handler  # type: ignore[assignment]
+        # A plain coroutine function is accepted in place of a PromptHandler.
+        self._prompt_callback: Callable[[MailboxMessage], Awaitable[None]] = getattr(
+            prompt_handler, "handle", prompt_handler
+        )
 
+        self._redis_client: Optional[AsyncRedis] = None
         self._shutdown_event = asyncio.Event()
         self._started = False
         self._handler_registered = False
@@ -105,8 +153,15 @@ class AgentRuntime:
         if not self._handler_registered:
             self.mailbox_service.register_handler(self._prompt_callback)
             self._handler_registered = True
+        self._attach_shared_client()
         await self.mailbox_service.start()
         self._started = True
+        # RedisMailboxService.start() connects; other mailbox implementations
+        # may not, so connect explicitly before giving up on a client.
+        self._redis_client = getattr(self.mailbox_service, "_client", None)
+        if self._redis_client is None:
+            await self.mailbox_service.connect()
+            self._redis_client = getattr(self.mailbox_service, "_client", None)
         await self._recover_pending_messages()
         LOGGER.info("Agent runtime started for agent_id=%s", self.config.agent_id)
 
@@ -117,11 +172,20 @@ class AgentRuntime:
         try:
             await self.mailbox_service.stop()
         finally:
+            store_aclose = getattr(self._context_store, "aclose", None)
+            if store_aclose is not None:
+                try:
+                    await store_aclose()
+                except Exception:  # pragma: no cover - context flush best-effort
+                    LOGGER.warning("Context store cleanup failed", exc_info=True)
             if self._provider and hasattr(self._provider, "aclose"):
                 try:
                     await self._provider.aclose()
                 except Exception:  # pragma: no cover - provider cleanup best-effort
                     LOGGER.debug("Provider cleanup failed", exc_info=True)
+            if self._redis_pool is not None:
+                await self._redis_pool.disconnect()
+            self._redis_client = None
             self._started = False
             self._shutdown_event.set()
             LOGGER.info("Agent runtime stopped for agent_id=%s", self.config.agent_id)
@@ -139,21 +203,21 @@ class AgentRuntime:
             await self.stop()
 
 
-    def _create_metrics_collector(self, config: AgentConfig):
-        if config.metrics_backend == "prometheus":
-            return PrometheusMetricsCollector(
-                agent_id=config.agent_id,
-                port=config.metrics_port,
-            )
-        return LoggingMetricsCollector()
+    def _attach_shared_client(self) -> None:
+        # RedisMailboxService.connect() keeps an existing client, so handing it
+        # one bound to the shared pool is enough. stop() drops the client, so
+        # this is repeated before every start().
+        if self._redis_pool is not None and getattr(self.mailbox_service, "_client", None) is None:
+            self.mailbox_service._client = AsyncRedis(connection_pool=self._redis_pool)
+
+    def _create_metrics_collector(self, config: AgentConfig) -> MetricsCollector:
+        factory = _METRICS_BACKENDS.get(config.metrics_backend, _METRICS_BACKENDS["logging"])
+        return factory(config)
 
     async def _recover_pending_messages(self) -> None:
         """Claim and process any pending mailbox messages from previous runs."""
         LOGGER.info("Starting pending recovery for agent_id=%s", self.config.agent_id)
-        client = getattr(self.mailbox_service, "_client", None)
-        if client is None:
-            await self.mailbox_service.connect()
-            client = getattr(self.mailbox_service, "_client", None)
+        client = self._redis_client
         if client is None:
             LOGGER.info("Pending recovery aborted - no Redis client for agent_id=%s", self.config.agent_id)
             return
@@ -165,6 +229,19 @@ class AgentRuntime:
             LOGGER.info("Pending recovery aborted - missing group/consumer for agent_id=%s", self.config.agent_id)
             return
 
+        # Bound once: these are read for every recovered entry.
+        agent_id = self.config.agent_id
+        handle = self._prompt_callback
+        from_fields = MailboxMessage.from_redis_fields
+        log_debug = LOGGER.debug
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+
+        async def _recover(message_id, fields) -> None:
+            async with semaphore:
+                mailbox_message = from_fields(fields)
+                log_debug("Recovering pending message_id=%s for agent_id=%s", message_id, agent_id)
+                await handle(mailbox_message)
+
         recovered = 0
         try:
             cursor = "0-0"
@@ -175,44 +252,52 @@ class AgentRuntime:
                     consumer,
                     min_idle_time=0,
                     start_id=cursor,
-                    count=50,
+                    count=self.config.recovery_batch_size,
                 )
                 LOGGER.info(
                     "Pending recovery iteration for agent_id=%s: cursor=%s entries=%s",
-                    self.config.agent_id,
+                    agent_id,
                     cursor,
                     len(entries),
                 )
-                if not entries:
-                    break
-                for message_id, fields in entries:
-                    mailbox_message = MailboxMessage.from_redis_fields(fields)
-                    LOGGER.info(
-                        "Recovering pending message_id=%s for agent_id=%s",
-                        message_id,
-                        self.config.agent_id,
-                    )
-                    await self._prompt_handler.handle(mailbox_message)
-                    LOGGER.info(
-                        "Completed recovery handling for message_id=%s agent_id=%s",
-                        message_id,
-                        self.config.agent_id,
-                    )
-                    await client.xack(stream, group, message_id)
-                    recovered += 1
-                if cursor == "0-0":
+                # Handle the batch concurrently, at most ``concurrency`` at a time.
+                results = await asyncio.gather(
+                    *(_recover(message_id, fields) for message_id, fields in entries),
+                    return_exceptions=True,
+                )
+                ack_ids = []
+                for (message_id, _), result in zip(entries, results):
+                    if isinstance(result, BaseException):
+                        # Leave the entry pending so a later recovery can retry it.
+                        LOGGER.warning(
+                            "Recovery handling failed for message_id=%s agent_id=%s: %s",
+                            message_id,
+                            agent_id,
+                            result,
+                        )
+                        continue
+                    ack_ids.append(message_id)
+                if ack_ids:
+                    # XACK is variadic: acknowledge the whole batch in one round-trip.
+                    await client.xack(stream, group, *ack_ids)
+                    recovered += len(ack_ids)
+                # A 0-0 cursor means the sweep has wrapped; anything still pending
+                # (failed entries) is left for the next recovery instead of
+                # being reclaimed in a loop. An empty batch with a non-zero
+                # cursor only skipped deleted entries, so keep going.
+                if _stream_id(cursor) == "0-0":
                     break
         except ResponseError as exc:
             if "NOGROUP" in str(exc) or "no such key" in str(exc):
                 return
-            LOGGER.warning("Pending recovery failed for agent_id=%s: %s", self.config.agent_id, exc)
+            LOGGER.warning("Pending recovery failed for agent_id=%s: %s", agent_id, exc)
         except Exception:
-            LOGGER.exception("Unexpected error during pending recovery for agent_id=%s", self.config.agent_id)
+            LOGGER.exception("Unexpected error during pending recovery for agent_id=%s", agent_id)
         if recovered:
             LOGGER.info(
                 "Recovered %s pending mailbox messages for agent_id=%s",
                 recovered,
-                self.config.agent_id,
+                agent_id,
             )
 
 
@@ -220,8 +305,13 @@ async def perform_healthcheck(
     config: AgentConfig,
     mailbox_factory: Optional[Callable[[AgentConfig], RedisMailboxService]] = None,
 ) -> bool:
-    """Attempt to connect to the mailbox backend."""
-    mailbox_factory = mailbox_factory or (lambda cfg: RedisMailboxService(cfg.agent_id, cfg.to_mailbox_config()))
+    """Attempt to connect to the mailbox backend.
+
+    By default this is a single ``PING`` on a short-lived client; pass
+    ``mailbox_factory`` to check through a full mailbox service instead.
+    """
+    if mailbox_factory is None:
+        return await _ping_redis(config)
     mailbox = mailbox_factory(config)
     try:
         await mailbox.connect()
@@ -236,3 +326,16 @@ async def perform_healthcheck(
                 await mailbox.stop()
             except Exception:
                 LOGGER.debug("Error stopping mailbox after healthcheck", exc_info=True)
+
+
+async def _ping_redis(config: AgentConfig) -> bool:
+    client = AsyncRedis.from_url(config.redis_url, socket_connect_timeout=config.request_timeout)
+    try:
+        await client.ping()
+        LOGGER.info("Healthcheck succeeded for agent_id=%s", config.agent_id)
+        return True
+    except Exception as exc:
+        LOGGER.warning("Healthcheck failed for agent_id=%s: %s", config.agent_id, exc)
+        return False
+    finally:
+        await client.aclose()
@@ -10,4 +10,38 @@ SRC_PATH = Path(__file__).resolve().parent.parent / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-# Fixtures will be added here as implementation progresses
+
+
+@pytest.fixture(scope="session")
+def redis_container_url():
+    """Start one Redis container for the whole session and yield its URL."""
+    try:
+        from testcontainers.redis import RedisContainer
+        from docker.errors import DockerException
+    except ModuleNotFoundError:
+        pytest.skip("testcontainers not available")
+
+    try:
+        container = RedisContainer("redis:7-alpine")
+        container.start()
+    except DockerException as exc:  # pragma: no cover - environment specific
+        pytest.skip(f"Docker unavailable: {exc}")
+    try:
+        host = container.get_container_host_ip()
+        port = container.get_exposed_port(container.port)
+        yield f"redis://{host}:{port}/0"
+    finally:
+        container.stop()
+
+
+@pytest.fixture
+def redis_url(redis_container_url):
+    """Shared container URL with the database flushed before each test."""
+    import redis
+
+    client = redis.Redis.from_url(redis_container_url)
+    try:
+        client.flushdb()
+    finally:
+        client.close()
+    return redis_container_url
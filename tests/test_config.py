@@ -40,6 +40,8 @@ def test_config_from_env_with_defaults(monkeypatch):
     assert config.context_redis_url == "redis://localhost:6379/0"
     assert config.metrics_backend == "logging"
     assert config.metrics_port is None
+    assert config.recovery_batch_size == 500
+    assert config.stream_threshold is None
 
 
 def test_config_from_env_overrides(monkeypatch):
@@ -65,6 +67,8 @@ def test_config_from_env_overrides(monkeypatch):
             "BEAST_LOG_LEVEL": "DEBUG",
             "BEAST_POLL_INTERVAL": "1.5",
             "BEAST_STREAM_MAXLEN": "4096",
+            "BEAST_RECOVERY_BATCH_SIZE": "200",
+            "BEAST_STREAM_THRESHOLD": "2048",
         },
     )
 
@@ -86,6 +90,8 @@ def test_config_from_env_overrides(monkeypatch):
     assert config.log_level == "DEBUG"
     assert config.poll_interval == pytest.approx(1.5)
     assert config.stream_maxlen == 4096
+    assert config.recovery_batch_size == 200
+    assert config.stream_threshold == 2048
 
 
 @pytest.mark.parametrize(
@@ -109,6 +115,17 @@ def test_config_missing_required(monkeypatch, env_key):
     assert env_key in str(exc.value)
 
 
+def test_config_reports_every_missing_required_value(monkeypatch):
+    """All missing required values should be named in a single error."""
+    _apply_env(monkeypatch, {"BEAST_AGENT_ID": "agent-1"})
+
+    with pytest.raises(ConfigError) as exc:
+        AgentConfig.from_env()
+
+    assert "BEAST_REDIS_URL" in str(exc.value)
+    assert "BEAST_OPENAI_API_KEY" in str(exc.value)
+
+
 def test_config_validation_bounds(monkeypatch):
     """Invalid numeric bounds should trigger ConfigError."""
     _apply_env(
@@ -125,3 +142,104 @@ def test_config_validation_bounds(monkeypatch):
         AgentConfig.from_env()
 
     assert "BEAST_CONCURRENCY" in str(exc.value)
+
+
+def test_config_rejects_non_positive_stream_threshold(monkeypatch):
+    _apply_env(
+        monkeypatch,
+        {
+            "BEAST_AGENT_ID": "agent-1",
+            "BEAST_REDIS_URL": "redis://localhost:6379/0",
+            "BEAST_OPENAI_API_KEY": "test-key",
+            "BEAST_STREAM_THRESHOLD": "0",
+        },
+    )
+
+    with pytest.raises(ConfigError) as exc:
+        AgentConfig.from_env()
+
+    assert "BEAST_STREAM_THRESHOLD" in str(exc.value)
+
+
+def test_config_from_env_is_cached_until_env_changes(monkeypatch):
+    """Repeated calls should reuse the parsed config while the environment is unchanged."""
+    _apply_env(
+        monkeypatch,
+        {
+            "BEAST_AGENT_ID": "agent-cache",
+            "BEAST_REDIS_URL": "redis://localhost:6379/0",
+            "BEAST_OPENAI_API_KEY": "test-key",
+        },
+    )
+
+    first = AgentConfig.from_env()
+    assert AgentConfig.from_env() is first
+
+    # Only recognised variables key the cache.
+    monkeypatch.setenv("UNRELATED_SETTING", "x")
+    monkeypatch.setenv("BEAST_UNUSED_SETTING", "x")
+    assert AgentConfig.from_env() is first
+
+    monkeypatch.setenv("BEAST_CONCURRENCY", "4")
+    updated = AgentConfig.from_env()
+
+    assert updated is not first
+    assert updated.concurrency == 4
+
+
+def test_config_from_env_cache_hit_skips_parsing(monkeypatch):
+    """A cache hit should cost only the variable lookups, not a re-parse."""
+    _apply_env(
+        monkeypatch,
+        {
+            "BEAST_AGENT_ID": "agent-parse",
+            "BEAST_REDIS_URL": "redis://localhost:6379/0",
+            "BEAST_OPENAI_API_KEY": "test-key",
+        },
+    )
+    first = AgentConfig.from_env()
+
+    def _fail(cls, env):
+        raise AssertionError("cached config was re-parsed")
+
+    monkeypatch.setattr(AgentConfig, "_from_values", classmethod(_fail))
+    assert AgentConfig.from_env() is first
+
+
+def test_config_from_explicit_mapping():
+    """An explicit mapping should bypass the process environment."""
+    config = AgentConfig.from_env(
+        {
+            "BEAST_AGENT_ID": "agent-map",
+            "BEAST_REDIS_URL": "redis://localhost:6379/0",
+            "BEAST_OPENAI_API_KEY": "test-key",
+            "UNRELATED": "ignored",
+        }
+    )
+
+    assert config.agent_id == "agent-map"
+    assert config.mailbox_stream == "beast:mailbox:agent-map:in"
+
+
+def test_merged_options_layers_overrides_without_copying():
+    """Prompt overrides should win without mutating or copying the defaults."""
+    config = AgentConfig.from_env(
+        {
+            "BEAST_AGENT_ID": "agent-opts",
+            "BEAST_REDIS_URL": "redis://localhost:6379/0",
+            "BEAST_OPENAI_API_KEY": "test-key",
+        }
+    )
+
+    assert config.merged_options() is config.default_options
+    assert config.merged_options({"temperature": None}) is config.default_options
+
+    merged = config.merged_options({"temperature": 0.9})
+    assert merged["temperature"] == 0.9
+    assert merged["max_tokens"] == config.max_tokens
+    assert config.default_options["temperature"] == 0.2
+
+    with pytest.raises(TypeError):
+        config.merged_options()["timeout"] = 1.0  # type: ignore[index]
+    with pytest.raises((TypeError, AttributeError)):
+        merged.pop("temperature")  # type: ignore[attr-defined]
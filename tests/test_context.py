@@ -1,5 +1,8 @@
 """Tests for context store implementations."""
 
+import asyncio
+import json
+
 import pytest
 
 import fakeredis.aioredis
@@ -30,6 +33,20 @@ async def test_inmemory_context_store_roundtrip():
     assert await store.get("thread") is None
 
 
+@pytest.mark.asyncio
+async def test_inmemory_context_store_evicts_least_recently_used():
+    store = InMemoryContextStore(maxsize=2)
+    await store.set("a", {"n": 1})
+    await store.set("b", {"n": 2})
+    assert await store.get("a") == {"n": 1}
+
+    await store.set("c", {"n": 3})
+
+    assert await store.get("b") is None
+    assert await store.get("a") == {"n": 1}
+    assert await store.get("c") == {"n": 3}
+
+
 @pytest.mark.asyncio
 async def test_redis_context_store_roundtrip():
     fake_client = fakeredis.aioredis.FakeRedis()
@@ -40,3 +57,129 @@ async def test_redis_context_store_roundtrip():
     assert value == {"state": 1}
     await store.clear("thread")
     assert await store.get("thread") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_context_store_serves_recent_reads_locally():
+    fake_client = fakeredis.aioredis.FakeRedis()
+    store = RedisContextStore(prefix="ctx", redis_client=fake_client, local_ttl=60, local_maxsize=8)
+    await store.set("thread", {"state": 1})
+
+    calls = 0
+    original_get = fake_client.get
+
+    async def counting_get(name):
+        nonlocal calls
+        calls += 1
+        return await original_get(name)
+
+    fake_client.get = counting_get
+
+    assert await store.get("thread") == {"state": 1}
+    assert await store.get("thread") == {"state": 1}
+    assert calls == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_context_store_revalidates_stale_entries():
+    fake_client = fakeredis.aioredis.FakeRedis()
+    store = RedisContextStore(prefix="ctx", redis_client=fake_client, local_ttl=0, local_maxsize=8)
+    await store.set("thread", {"state": 1})
+    await store.flush()
+    await fake_client.set("ctx:thread", b'{"state": 2}')
+
+    # The stale local copy is returned immediately and refreshed in the background.
+    assert await store.get("thread") == {"state": 1}
+    await asyncio.sleep(0.01)
+    assert await store.get("thread") == {"state": 2}
+
+
+@pytest.mark.asyncio
+async def test_redis_context_store_reads_through_entries_past_max_stale():
+    fake_client = fakeredis.aioredis.FakeRedis()
+    store = RedisContextStore(
+        prefix="ctx", redis_client=fake_client, local_ttl=0, local_max_stale=0, local_maxsize=8
+    )
+    await store.set("thread", {"state": 1})
+    await store.flush()
+    await fake_client.set("ctx:thread", b'{"state": 2}')
+
+    assert await store.get("thread") == {"state": 2}
+
+
+@pytest.mark.asyncio
+async def test_redis_context_store_local_reads_return_copies():
+    fake_client = fakeredis.aioredis.FakeRedis()
+    store = RedisContextStore(prefix="ctx", redis_client=fake_client, local_ttl=60, local_maxsize=8)
+    value = {"messages": ["hi"]}
+    await store.set("thread", value)
+    value["messages"].append("mutated before read")
+
+    first = await store.get("thread")
+    first["messages"].append("mutated after read")
+
+    assert await store.get("thread") == {"messages": ["hi"]}
+
+
+@pytest.mark.asyncio
+async def test_redis_context_store_batches_buffered_writes():
+    fake_client = fakeredis.aioredis.FakeRedis()
+    store = RedisContextStore(prefix="ctx", redis_client=fake_client, write_delay=60)
+
+    await store.set("a", {"n": 1}, ttl=60)
+    await store.set("b", {"n": 2})
+    await store.set("a", {"n": 3}, ttl=60)
+
+    assert await fake_client.get("ctx:a") is None
+    assert await store.get("a") == {"n": 3}
+
+    await store.flush()
+
+    assert json.loads(await fake_client.get("ctx:a")) == {"n": 3}
+    assert 0 < await fake_client.ttl("ctx:a") <= 60
+    assert await fake_client.get("ctx:b") is not None
+    assert await fake_client.ttl("ctx:b") == -1
+
+
+@pytest.mark.asyncio
+async def test_redis_context_store_drops_failed_unbuffered_write():
+    fake_client = fakeredis.aioredis.FakeRedis()
+    store = RedisContextStore(prefix="ctx", redis_client=fake_client, local_maxsize=8)
+    original_set = fake_client.set
+
+    async def failing_set(*args, **kwargs):
+        raise ConnectionError("down")
+
+    fake_client.set = failing_set
+    with pytest.raises(ConnectionError):
+        await store.set("a", {"n": 1})
+    fake_client.set = original_set
+
+    assert await store.get("a") is None
+    await store.set("b", {"n": 1})
+    assert await fake_client.get("ctx:a") is None
+    assert json.loads(await fake_client.get("ctx:b")) == {"n": 1}
+
+
+@pytest.mark.asyncio
+async def test_redis_context_store_keeps_writes_from_failed_flush():
+    fake_client = fakeredis.aioredis.FakeRedis()
+    store = RedisContextStore(prefix="ctx", redis_client=fake_client, write_delay=60, local_maxsize=8)
+    await store.set("a", {"n": 1})
+    await store.set("b", {"n": 1})
+
+    original_pipeline = fake_client.pipeline
+
+    def failing_pipeline(**kwargs):
+        raise ConnectionError("down")
+
+    fake_client.pipeline = failing_pipeline
+    with pytest.raises(ConnectionError):
+        await store.flush()
+    fake_client.pipeline = original_pipeline
+
+    await store.set("a", {"n": 2})
+    await store.flush()
+
+    assert json.loads(await fake_client.get("ctx:a")) == {"n": 2}
+    assert json.loads(await fake_client.get("ctx:b")) == {"n": 1}
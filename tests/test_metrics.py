@@ -13,8 +13,12 @@ def test_logging_metrics_collector_logs(monkeypatch):
     logs = {}
 
     class _Logger:
-        def info(self, name, extra=None):
-            logs["name"] = name
+        def isEnabledFor(self, level):
+            return True
+
+        def info(self, msg, *args, extra=None):
+            logs["name"] = msg.split(" ", 1)[0]
+            logs["message"] = msg % args
             logs["extra"] = extra
 
     collector = LoggingMetricsCollector(logger=_Logger())
@@ -33,9 +37,32 @@ def test_logging_metrics_collector_logs(monkeypatch):
     )
 
     assert logs["name"] == "prompt_metrics"
+    assert logs["message"] == "prompt_metrics agent=agent-a msg=msg-1 status=success dur=12.500 attempts=1"
     assert logs["extra"]["metrics"]["status"] == "success"
 
 
+def test_logging_metrics_collector_skips_disabled_logger():
+    class _Logger:
+        def isEnabledFor(self, level):
+            return False
+
+        def info(self, msg, *args, extra=None):  # pragma: no cover - must not run
+            raise AssertionError("info() called while INFO is disabled")
+
+    collector = LoggingMetricsCollector(logger=_Logger())
+    collector.record(
+        MetricsEvent(
+            agent_id="agent-a",
+            message_id="msg-1",
+            sender="client",
+            status="success",
+            provider="stub",
+            duration_ms=12.5,
+            attempts=1,
+        )
+    )
+
+
 def test_prometheus_metrics_collector_records_values():
     registry = CollectorRegistry()
     collector = PrometheusMetricsCollector(agent_id="agent-b", registry=registry)
@@ -103,3 +130,33 @@ def test_prometheus_metrics_collector_records_values():
         labels={"agent_id": "agent-b", "status": "error"},
     )
     assert attempts_sum == 3.0
+
+
+def test_prometheus_metrics_collector_reuses_bound_children():
+    registry = CollectorRegistry()
+    collector = PrometheusMetricsCollector(agent_id="agent-c", registry=registry)
+    event = MetricsEvent(
+        agent_id="agent-c",
+        message_id="msg-1",
+        sender="client",
+        status="success",
+        provider="stub",
+        duration_ms=10.0,
+        attempts=1,
+    )
+
+    for _ in range(3):
+        collector.record(event)
+
+    assert collector._event_child.cache_info().hits == 2  # type: ignore[attr-defined]
+    total = registry.get_sample_value(
+        "beast_prompt_events_total",
+        labels={
+            "agent_id": "agent-c",
+            "status": "success",
+            "provider": "stub",
+            "retryable": "unknown",
+            "error_code": "none",
+        },
+    )
+    assert total == 3.0
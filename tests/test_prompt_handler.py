@@ -160,7 +160,8 @@ async def test_prompt_handler_handles_non_retryable_error(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_prompt_handler_retries_retryable_errors(monkeypatch):
+@pytest.mark.parametrize("backoff_base", [0.0, 0.1, 1.0])
+async def test_prompt_handler_retries_retryable_errors(monkeypatch, backoff_base):
     """Retryable errors should be attempted up to retry_max."""
     provider = _FailingProvider(retryable=True)
     responses = []
@@ -170,7 +171,7 @@ async def test_prompt_handler_retries_retryable_errors(monkeypatch):
         responses.append(payload)
 
     handler = PromptHandler(
-        config=_make_config(retry_max=3, retry_backoff_base=0),
+        config=_make_config(retry_max=3, retry_backoff_base=backoff_base),
         provider=provider,
         send_response=record_response,
         metrics=metrics,
@@ -178,20 +179,82 @@ async def test_prompt_handler_retries_retryable_errors(monkeypatch):
 
     message = _make_message({"prompt": "try again"})
 
-    # Avoid actual sleep in tests
-    async def _instant_sleep(_):
-        return None
+    # Record the backoff instead of sleeping; jitter pinned to zero.
+    delays = []
+
+    async def _instant_sleep(delay):
+        delays.append(delay)
 
     monkeypatch.setattr("asyncio.sleep", _instant_sleep)
+    monkeypatch.setattr("beast_mailbox_agent.handlers.random", lambda: 0.0)
 
     await handler.handle(message)
 
+    assert delays == ([backoff_base, backoff_base * 2] if backoff_base else [])
     assert provider.calls == 3
     assert responses[0]["status"] == "error"
     assert responses[0]["error"]["retryable"] is True
     assert metrics.events[-1].attempts == 3
 
 
+@pytest.mark.asyncio
+async def test_prompt_handler_backoff_is_capped_and_jittered(monkeypatch):
+    """Retry delays should grow exponentially with bounded jitter, never past the cap."""
+    delays = []
+
+    async def _record_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("asyncio.sleep", _record_sleep)
+    monkeypatch.setattr("beast_mailbox_agent.handlers.random", lambda: 1.0)
+
+    async def record_response(recipient, payload, **kwargs):
+        return None
+
+    handler = PromptHandler(
+        config=_make_config(retry_max=8, retry_backoff_base=1.0),
+        provider=_FailingProvider(retryable=True),
+        send_response=record_response,
+        metrics=_RecorderMetrics(),
+    )
+
+    await handler.handle(_make_message({"prompt": "try again"}))
+
+    assert delays == pytest.approx([1.1, 2.2, 4.4, 8.8, 17.6, 30.0, 30.0])
+
+
+@pytest.mark.asyncio
+async def test_prompt_handler_frees_provider_slot_during_backoff():
+    """A message backing off before a retry should not block other prompts."""
+    calls = []
+
+    class FlakyProvider:
+        async def generate(self, request: PromptRequest) -> ProviderResponse:
+            calls.append(request.prompt)
+            if request.prompt == "flaky" and calls.count("flaky") == 1:
+                raise ProviderError(code="rate_limited", message="slow down", retryable=True)
+            return ProviderResponse(
+                content="ok", model="stub", request_id=request.prompt, usage={}, provider="stub"
+            )
+
+    async def record_response(recipient, payload, **kwargs):
+        return None
+
+    handler = PromptHandler(
+        config=_make_config(concurrency=1, retry_max=2, retry_backoff_base=0.05),
+        provider=FlakyProvider(),
+        send_response=record_response,
+        metrics=_RecorderMetrics(),
+    )
+
+    await asyncio.gather(
+        handler.handle(_make_message({"prompt": "flaky"})),
+        handler.handle(_make_message({"prompt": "steady"})),
+    )
+
+    assert calls == ["flaky", "steady", "flaky"]
+
+
 @pytest.mark.asyncio
 async def test_prompt_handler_validates_payload(monkeypatch):
     """Malformed payloads should yield an actionable error response."""
@@ -264,6 +327,89 @@ async def test_prompt_handler_enforces_concurrency_limit():
     assert metrics.events[1].status == "success"
 
 
+@pytest.mark.asyncio
+async def test_prompt_handler_set_concurrency_admits_waiters():
+    """Raising the limit mid-run should admit a queued message without a restart."""
+    release = asyncio.Event()
+    entered = []
+
+    class GatedProvider:
+        async def generate(self, request: PromptRequest) -> ProviderResponse:
+            entered.append(request.prompt)
+            await release.wait()
+            return ProviderResponse(
+                content="ok",
+                model="model",
+                request_id="req",
+                usage={},
+                provider="stub",
+            )
+
+    async def record_response(recipient, payload, **kwargs):
+        return None
+
+    handler = PromptHandler(
+        config=_make_config(concurrency=1),
+        provider=GatedProvider(),
+        send_response=record_response,
+        metrics=_RecorderMetrics(),
+    )
+
+    calls = asyncio.gather(
+        handler.handle(_make_message({"prompt": "first"})),
+        handler.handle(_make_message({"prompt": "second"})),
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert len(entered) == 1
+
+    handler.set_concurrency(2)
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert sorted(entered) == ["first", "second"]
+
+    with pytest.raises(ValueError):
+        handler.set_concurrency(0)
+
+    release.set()
+    await calls
+
+
+@pytest.mark.asyncio
+async def test_prompt_handler_sends_replies_outside_provider_slot():
+    """Reply delivery should overlap the next provider call without exceeding the cap."""
+    generating = 0
+    peak = 0
+    overlapped = False
+
+    class SlowProvider:
+        async def generate(self, request: PromptRequest) -> ProviderResponse:
+            nonlocal generating, peak
+            generating += 1
+            peak = max(peak, generating)
+            await asyncio.sleep(0.01)
+            generating -= 1
+            return ProviderResponse(content="ok", model="model", request_id="req", usage={}, provider="stub")
+
+    async def slow_send(recipient, payload, **kwargs):
+        nonlocal overlapped
+        await asyncio.sleep(0.005)
+        overlapped = overlapped or generating > 0
+        await asyncio.sleep(0.005)
+
+    handler = PromptHandler(
+        config=_make_config(concurrency=1),
+        provider=SlowProvider(),
+        send_response=slow_send,
+        metrics=_RecorderMetrics(),
+    )
+
+    await asyncio.gather(*(handler.handle(_make_message({"prompt": f"p{i}"})) for i in range(4)))
+
+    assert peak == 1
+    assert overlapped is True
+
+
 @pytest.mark.asyncio
 async def test_prompt_handler_updates_context_store():
     """Context store should capture conversation history when enabled."""
@@ -319,6 +465,47 @@ async def test_prompt_handler_handles_unexpected_exception():
 
     assert responses[0]["error"]["code"] == "unhandled_error"
     assert metrics.events[-1].error_code == "unhandled_error"
+
+
+@pytest.mark.asyncio
+async def test_prompt_handler_cancelled_waiter_does_not_leak_slot():
+    """Cancelling a message queued for a provider slot should leave the slot count intact."""
+    release = asyncio.Event()
+    entered = []
+
+    class GatedProvider:
+        async def generate(self, request: PromptRequest) -> ProviderResponse:
+            entered.append(request.prompt)
+            await release.wait()
+            return ProviderResponse(
+                content="ok", model="stub", request_id=request.prompt, usage={}, provider="stub"
+            )
+
+    async def record_response(recipient, payload, **kwargs):
+        return None
+
+    handler = PromptHandler(
+        config=_make_config(concurrency=1),
+        provider=GatedProvider(),
+        send_response=record_response,
+        metrics=_RecorderMetrics(),
+    )
+
+    first = asyncio.create_task(handler.handle(_make_message({"prompt": "first"})))
+    waiting = asyncio.create_task(handler.handle(_make_message({"prompt": "waiting"})))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    release.set()
+    await first
+    await asyncio.wait_for(handler.handle(_make_message({"prompt": "after"})), timeout=1.0)
+
+    assert entered == ["first", "after"]
+
+
 class _RecorderMetrics:
     def __init__(self):
         self.events: list[MetricsEvent] = []
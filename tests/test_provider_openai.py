@@ -1,5 +1,6 @@
 """Tests for the OpenAI provider adapter."""
 
+import json
 from types import SimpleNamespace
 
 import httpx
@@ -11,50 +12,69 @@ from beast_mailbox_agent.providers.base import PromptRequest, ProviderError
 from beast_mailbox_agent.providers.openai import OpenAIChatProvider
 
 
-class _FakeCompletions:
-    def __init__(self, response):
-        self._response = response
-        self.calls = []
+class _MockOpenAI:
+    """Serve canned Chat Completions responses through httpx.MockTransport."""
 
-    async def create(self, **kwargs):
-        self.calls.append(kwargs)
-        return self._response
+    def __init__(self, *, completion=None, stream_chunks=None):
+        self._completion = completion
+        self._stream_chunks = stream_chunks
+        self.requests = []
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
 
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/chat/completions")
+        self.requests.append(request)
+        if self._stream_chunks is None:
+            return httpx.Response(200, json=self._completion)
+        body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in self._stream_chunks) + "data: [DONE]\n\n"
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
 
-class _FakeClient:
-    def __init__(self, response):
-        self.chat = SimpleNamespace(completions=_FakeCompletions(response))
-        self.closed = False
-        self.timeout_options = None
+    def body(self, index=0):
+        return json.loads(self.requests[index].content)
 
-    def with_options(self, **kwargs):
-        self.timeout_options = kwargs
-        return self
+    def timeout(self, index=0):
+        return self.requests[index].extensions["timeout"]["read"]
 
-    def close(self):
-        self.closed = True
 
+def _completion(content, *, model="test-model", request_id="resp-1", usage=None):
+    return {
+        "id": request_id,
+        "object": "chat.completion",
+        "created": 0,
+        "model": model,
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+        ],
+        "usage": usage,
+    }
 
-@pytest.mark.asyncio
-async def test_openai_provider_success(monkeypatch):
-    fake_response = SimpleNamespace(
-        choices=[SimpleNamespace(message=SimpleNamespace(content="result text"))],
-        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15),
-        model="test-model",
-        id="resp-1",
-    )
-    fake_client = _FakeClient(fake_response)
 
-    monkeypatch.setattr(
-        "beast_mailbox_agent.providers.openai.AsyncOpenAI",
-        lambda *args, **kwargs: fake_client,
-    )
+def _chunk(content=None, usage=None):
+    choices = [] if content is None else [{"index": 0, "delta": {"content": content}, "finish_reason": None}]
+    return {
+        "id": "resp-3",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "stream-model",
+        "choices": choices,
+        "usage": usage,
+    }
+
 
+@pytest.mark.asyncio
+async def test_openai_provider_success():
+    mock = _MockOpenAI(
+        completion=_completion(
+            "result text",
+            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        )
+    )
     provider = OpenAIChatProvider(
         api_key="key",
         default_model="default-model",
         timeout=20.0,
         default_options={"temperature": 0.1},
+        http_client=mock.client,
     )
 
     request = PromptRequest(
@@ -70,10 +90,87 @@ async def test_openai_provider_success(monkeypatch):
     assert response.model == "test-model"
     assert response.request_id == "resp-1"
     assert response.usage["total_tokens"] == 15
-    assert fake_client.timeout_options == {"timeout": 5.0}
-    assert fake_client.chat.completions.calls[0]["model"] == "default-model"
+    body = mock.body()
+    assert body["model"] == "default-model"
+    assert body["temperature"] == 0.1
+    assert body["messages"][-1] == {"role": "user", "content": "Tell me something"}
+    assert mock.timeout() == 5.0
+
+    # Repeated requests with the same override reuse the derived client.
+    await provider.generate(request)
+    assert provider._client_with_timeout.cache_info().misses == 1
     await provider.aclose()
-    assert fake_client.closed is True
+    # The caller owns the supplied HTTP client; the provider reopens on reuse.
+    assert not mock.client.is_closed
+    response = await provider.generate(request)
+    assert response.content == "result text"
+    assert len(mock.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_openai_provider_passes_defaults_without_overrides():
+    mock = _MockOpenAI(completion=_completion("ok", request_id="resp-2"))
+    provider = OpenAIChatProvider(
+        api_key="key",
+        default_model="default-model",
+        timeout=20.0,
+        default_options={"model": "configured-model", "timeout": 7.0, "temperature": 0.1},
+        http_client=mock.client,
+    )
+
+    response = await provider.generate(PromptRequest(prompt="hi", options={}, metadata={}))
+
+    body = mock.body()
+    assert body["model"] == "configured-model"
+    assert body["temperature"] == 0.1
+    assert "timeout" not in body
+    assert mock.timeout() == 7.0
+    assert response.usage == {}
+
+    await provider.generate(PromptRequest(prompt="again", options={"timeout": 7.0}, metadata={}))
+    assert provider._client_with_timeout.cache_info().misses == 0
+
+
+@pytest.mark.asyncio
+async def test_openai_provider_streams_long_completions():
+    usage = {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}
+    mock = _MockOpenAI(stream_chunks=[_chunk("Hel"), _chunk("lo"), _chunk(usage=usage)])
+    provider = OpenAIChatProvider(
+        api_key="key",
+        default_model="default-model",
+        timeout=20.0,
+        stream_threshold=256,
+        http_client=mock.client,
+    )
+
+    response = await provider.generate(PromptRequest(prompt="hi", options={"max_tokens": 512}, metadata={}))
+
+    assert mock.body()["stream"] is True
+    assert response.content == "Hello"
+    assert response.model == "stream-model"
+    assert response.request_id == "resp-3"
+    assert response.usage["total_tokens"] == 5
+
+
+@pytest.mark.asyncio
+async def test_openai_provider_honours_stream_option():
+    mock = _MockOpenAI(stream_chunks=[_chunk("partial "), _chunk("reply")])
+    provider = OpenAIChatProvider(
+        api_key="key",
+        default_model="default-model",
+        timeout=20.0,
+        http_client=mock.client,
+    )
+
+    response = await provider.generate(
+        PromptRequest(prompt="hi", options={"stream": True, "max_tokens": 16}, metadata={})
+    )
+
+    body = mock.body()
+    assert body["stream"] is True
+    assert body["stream_options"] == {"include_usage": True}
+    assert response.content == "partial reply"
+    assert response.usage == {}
 
 
 class _ErrorClient:
@@ -84,7 +181,7 @@ class _ErrorClient:
     def with_options(self, **kwargs):
         return self
 
-    def close(self):
+    async def close(self):
         pass
 
     async def create(self, **kwargs):
@@ -132,3 +229,31 @@ async def test_openai_provider_wraps_api_error(monkeypatch):
 
     assert exc.value.code == "server_error"
     assert exc.value.details["status_code"] == 500
+
+
+@pytest.mark.asyncio
+async def test_openai_provider_reopens_owned_client_after_aclose(monkeypatch):
+    created = []
+
+    class _ClosingClient(_ErrorClient):
+        closed = False
+
+        async def close(self):
+            self.closed = True
+
+    def _factory(*args, **kwargs):
+        created.append(_ClosingClient(lambda: RuntimeError("unused")))
+        return created[-1]
+
+    monkeypatch.setattr("beast_mailbox_agent.providers.openai.AsyncOpenAI", _factory)
+    provider = OpenAIChatProvider(api_key="key", default_model="model", timeout=1.0)
+
+    with pytest.raises(ProviderError):
+        await provider.generate(PromptRequest(prompt="first", options={}, metadata={}))
+    await provider.aclose()
+    with pytest.raises(ProviderError):
+        await provider.generate(PromptRequest(prompt="second", options={}, metadata={}))
+
+    assert len(created) == 2
+    assert created[0].closed is True
+    assert created[1].closed is False
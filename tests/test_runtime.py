@@ -4,13 +4,16 @@ import asyncio
 from dataclasses import replace
 from types import SimpleNamespace
 
+import fakeredis.aioredis
+import httpx
 import pytest
 
 from beast_mailbox_core import MailboxMessage
 
 from beast_mailbox_agent.config import AgentConfig
 from beast_mailbox_agent.metrics import PrometheusMetricsCollector
-from beast_mailbox_agent.runtime import AgentRuntime, perform_healthcheck
+from beast_mailbox_agent.providers.openai import OpenAIChatProvider
+from beast_mailbox_agent.runtime import AgentRuntime, create_provider, perform_healthcheck
 
 
 def _config():
@@ -104,6 +107,37 @@ async def test_runtime_start_and_stop(monkeypatch):
     assert mailbox.stopped is True
 
 
+@pytest.mark.asyncio
+async def test_runtime_handles_prompts_after_restart():
+    """A stopped runtime should serve prompts again once restarted."""
+    completion = {
+        "id": "resp-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"}],
+    }
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=completion)))
+    mailbox = _StubMailbox()
+    runtime = AgentRuntime(
+        config=_config(),
+        mailbox_service=mailbox,
+        provider=OpenAIChatProvider(api_key="key", default_model="gpt-4o-mini", timeout=5.0, http_client=http_client),
+    )
+    message = MailboxMessage(message_id="msg", sender="sender", recipient="runtime-agent", payload={"prompt": "hello"})
+
+    await runtime.start()
+    await mailbox.handlers[0](message)
+    await runtime.stop()
+    await runtime.start()
+    await mailbox.handlers[0](message)
+    await runtime.stop()
+
+    assert len(mailbox.handlers) == 1
+    assert [payload["status"] for _, payload in mailbox.sent_messages] == ["success", "success"]
+    await http_client.aclose()
+
+
 @pytest.mark.asyncio
 async def test_perform_healthcheck_success(monkeypatch):
     """Healthcheck should validate mailbox connectivity."""
@@ -126,6 +160,27 @@ async def test_perform_healthcheck_success(monkeypatch):
     assert calls["connect"] is True
 
 
+@pytest.mark.asyncio
+async def test_perform_healthcheck_pings_redis_by_default(monkeypatch):
+    """Without a factory the healthcheck should be a single PING on a throwaway client."""
+    client = fakeredis.aioredis.FakeRedis()
+    pings = []
+    original_ping = client.ping
+
+    async def counting_ping(**kwargs):
+        pings.append(True)
+        return await original_ping(**kwargs)
+
+    client.ping = counting_ping
+    monkeypatch.setattr(
+        "beast_mailbox_agent.runtime.AsyncRedis.from_url",
+        lambda url, **kwargs: client,
+    )
+
+    assert await perform_healthcheck(_config()) is True
+    assert pings == [True]
+
+
 @pytest.mark.asyncio
 async def test_runtime_run_until_shutdown():
     """Run helper should respect shutdown requests."""
@@ -163,3 +218,161 @@ async def test_runtime_uses_prometheus_metrics(monkeypatch):
     runtime = AgentRuntime(config=config, mailbox_service=_StubMailbox())
 
     assert isinstance(runtime._prompt_handler._metrics, PrometheusMetricsCollector)  # type: ignore[attr-defined]
+
+
+def test_create_provider_passes_stream_threshold():
+    provider = create_provider(replace(_config(), stream_threshold=1024))
+
+    assert provider._stream_threshold == 1024  # type: ignore[attr-defined]
+
+
+class _RedisBackedMailbox(_StubMailbox):
+    inbox_stream = "beast:mailbox:runtime-agent:in"
+
+    def __init__(self, client):
+        super().__init__()
+        self._client = client
+        self._consumer_group = "runtime-agent:group"
+        self._consumer_name = "runtime-agent:fresh"
+
+
+async def _seed_pending(client, stream, group, count):
+    await client.xgroup_create(name=stream, groupname=group, id="0-0", mkstream=True)
+    for index in range(count):
+        message = MailboxMessage(
+            message_id=f"pending-{index}",
+            sender="sender",
+            recipient="runtime-agent",
+            payload={"prompt": f"recover {index}"},
+        )
+        await client.xadd(stream, message.to_redis_fields())
+    await client.xreadgroup(groupname=group, consumername="stalled", streams={stream: ">"}, count=count)
+
+
+@pytest.mark.asyncio
+async def test_runtime_recovers_pending_batch_with_single_ack():
+    """Pending entries should be handled and acknowledged in one XACK per batch."""
+    client = fakeredis.aioredis.FakeRedis()
+    mailbox = _RedisBackedMailbox(client)
+    await _seed_pending(client, mailbox.inbox_stream, mailbox._consumer_group, 3)
+
+    ack_calls = []
+    original_xack = client.xack
+
+    async def counting_xack(name, groupname, *ids):
+        ack_calls.append(ids)
+        return await original_xack(name, groupname, *ids)
+
+    client.xack = counting_xack
+    prompt_handler = _StubPromptHandler()
+    runtime = AgentRuntime(config=_config(), mailbox_service=mailbox, prompt_handler=prompt_handler)
+
+    await runtime.start()
+
+    assert sorted(call.message_id for call in prompt_handler.calls) == ["pending-0", "pending-1", "pending-2"]
+    assert len(ack_calls) == 1
+    assert len(ack_calls[0]) == 3
+    assert (await client.xpending(mailbox.inbox_stream, mailbox._consumer_group))["pending"] == 0
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_runtime_recovery_leaves_failed_entries_pending():
+    """Entries whose handler raises should not be acknowledged."""
+    client = fakeredis.aioredis.FakeRedis()
+    mailbox = _RedisBackedMailbox(client)
+    await _seed_pending(client, mailbox.inbox_stream, mailbox._consumer_group, 2)
+
+    class _FlakyHandler(_StubPromptHandler):
+        async def handle(self, message: MailboxMessage):
+            await super().handle(message)
+            if message.message_id == "pending-1":
+                raise RuntimeError("boom")
+
+    runtime = AgentRuntime(config=_config(), mailbox_service=mailbox, prompt_handler=_FlakyHandler())
+
+    await runtime.start()
+
+    assert (await client.xpending(mailbox.inbox_stream, mailbox._consumer_group))["pending"] == 1
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_runtime_recovery_handles_batch_concurrently():
+    """Recovered entries should overlap up to the configured concurrency."""
+    client = fakeredis.aioredis.FakeRedis()
+    mailbox = _RedisBackedMailbox(client)
+    await _seed_pending(client, mailbox.inbox_stream, mailbox._consumer_group, 5)
+
+    active = 0
+    peak = 0
+
+    class _SlowHandler(_StubPromptHandler):
+        async def handle(self, message: MailboxMessage):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            await super().handle(message)
+
+    handler = _SlowHandler()
+    runtime = AgentRuntime(config=_config(), mailbox_service=mailbox, prompt_handler=handler)
+
+    await runtime.start()
+
+    assert len(handler.calls) == 5
+    assert peak == _config().concurrency
+    assert (await client.xpending(mailbox.inbox_stream, mailbox._consumer_group))["pending"] == 0
+    await runtime.stop()
+
+
+def test_runtime_shares_redis_pool_between_mailbox_and_context():
+    """Runtime-built mailbox and context clients should use one connection pool."""
+    config = replace(_config(), context_enabled=True)
+    runtime = AgentRuntime(config=config, prompt_handler=_StubPromptHandler())
+
+    mailbox_pool = runtime.mailbox_service._client.connection_pool
+    assert mailbox_pool is runtime._redis_pool
+    assert runtime._context_store._client.connection_pool is mailbox_pool
+
+
+@pytest.mark.asyncio
+async def test_runtime_recovery_drains_backlog_across_batches():
+    """A backlog larger than one xautoclaim batch should be drained and acked in full."""
+    client = fakeredis.aioredis.FakeRedis()
+    mailbox = _RedisBackedMailbox(client)
+    stream, group = mailbox.inbox_stream, mailbox._consumer_group
+    await client.xgroup_create(name=stream, groupname=group, id="0-0", mkstream=True)
+
+    # Serialize once and reuse the fields for every entry in the backlog.
+    fields = MailboxMessage(
+        message_id="backlog",
+        sender="sender",
+        recipient="runtime-agent",
+        payload={"prompt": "recover"},
+    ).to_redis_fields()
+    async with client.pipeline(transaction=False) as pipe:
+        for _ in range(1000):
+            pipe.xadd(stream, fields)
+        await pipe.execute()
+    await client.xreadgroup(groupname=group, consumername="stalled", streams={stream: ">"}, count=1000)
+
+    ack_calls = []
+    original_xack = client.xack
+
+    async def counting_xack(name, groupname, *ids):
+        ack_calls.append(len(ids))
+        return await original_xack(name, groupname, *ids)
+
+    client.xack = counting_xack
+    handler = _StubPromptHandler()
+    config = replace(_config(), recovery_batch_size=100)
+    runtime = AgentRuntime(config=config, mailbox_service=mailbox, prompt_handler=handler)
+
+    await runtime.start()
+
+    assert len(handler.calls) == 1000
+    assert ack_calls == [100] * 10
+    assert (await client.xpending(stream, group))["pending"] == 0
+    await runtime.stop()
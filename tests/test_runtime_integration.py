@@ -1,7 +1,6 @@
 """Integration tests exercising runtime with a real Redis container."""
 
 import asyncio
-from contextlib import suppress
 
 import pytest
 
@@ -17,14 +16,6 @@ from beast_mailbox_agent.metrics import LoggingMetricsCollector
 from beast_mailbox_agent.providers.base import ProviderResponse, PromptRequest
 from beast_mailbox_agent.runtime import AgentRuntime
 
-try:
-    from testcontainers.redis import RedisContainer
-    from docker.errors import DockerException
-except ModuleNotFoundError:  # pragma: no cover - handled in test skip
-    RedisContainer = None  # type: ignore
-    DockerException = Exception  # type: ignore
-
-
 class _StubProvider:
     async def generate(self, request: PromptRequest) -> ProviderResponse:
         return ProviderResponse(
@@ -36,32 +27,11 @@ class _StubProvider:
         )
 
 
-async def _wait_for(predicate, timeout: float = 5.0, interval: float = 0.05) -> None:
-    deadline = asyncio.get_event_loop().time() + timeout
-    while not predicate():
-        if asyncio.get_event_loop().time() >= deadline:
-            raise asyncio.TimeoutError("condition not met in time")
-        await asyncio.sleep(interval)
-
-
 @pytest.mark.asyncio
-async def test_runtime_handles_message_with_real_redis():
-    if RedisContainer is None:
-        pytest.skip("testcontainers not available")
-
-    container = None
-    try:
-        container = RedisContainer("redis:7-alpine")
-        container.start()
-    except DockerException as exc:  # pragma: no cover - environment specific
-        pytest.skip(f"Docker unavailable: {exc}")
-
+async def test_runtime_handles_message_with_real_redis(redis_url):
     runtime: AgentRuntime | None = None
     sender_service: RedisMailboxService | None = None
     try:
-        host = container.get_container_host_ip()
-        port = container.get_exposed_port(container.port)
-        redis_url = f"redis://{host}:{port}/0"
         agent_id = "integration-agent"
         config = AgentConfig(
             agent_id=agent_id,
@@ -120,9 +90,11 @@ async def test_runtime_handles_message_with_real_redis():
         sender_service = RedisMailboxService("integration-sender", sender_config)
 
         received: list[MailboxMessage] = []
+        received_event = asyncio.Event()
 
         async def capture_response(msg: MailboxMessage) -> None:
             received.append(msg)
+            received_event.set()
 
         sender_service.register_handler(capture_response)
 
@@ -137,7 +109,7 @@ async def test_runtime_handles_message_with_real_redis():
             },
         )
 
-        await _wait_for(lambda: received)
+        await asyncio.wait_for(received_event.wait(), timeout=5.0)
 
         assert received[0].payload["status"] == "success"
         assert received[0].payload["response"]["content"] == "Echo: ping"
@@ -148,30 +120,18 @@ async def test_runtime_handles_message_with_real_redis():
             await runtime.stop()
         if sender_service is not None:
             await sender_service.stop()
-        with suppress(Exception):
-            container.stop()
 
 
 @pytest.mark.asyncio
-async def test_runtime_recovers_pending_entries():
-    if RedisContainer is None:
-        pytest.skip("testcontainers not available")
-
+async def test_runtime_recovers_pending_entries(redis_url):
     import logging
 
     logging.getLogger("beast_mailbox_agent.runtime").setLevel(logging.DEBUG)
 
-    container = None
     client = None
     runtime: AgentRuntime | None = None
     sender_service: RedisMailboxService | None = None
     try:
-        container = RedisContainer("redis:7-alpine")
-        container.start()
-
-        host = container.get_container_host_ip()
-        port = container.get_exposed_port(container.port)
-        redis_url = f"redis://{host}:{port}/0"
         agent_id = "integration-pending"
         config = AgentConfig(
             agent_id=agent_id,
@@ -220,9 +180,11 @@ async def test_runtime_recovers_pending_entries():
         )
         sender_service = RedisMailboxService("integration-sender", sender_config)
         responses: list[MailboxMessage] = []
+        response_event = asyncio.Event()
 
         async def capture_response(msg: MailboxMessage) -> None:
             responses.append(msg)
+            response_event.set()
 
         sender_service.register_handler(capture_response)
 
@@ -242,14 +204,16 @@ async def test_runtime_recovers_pending_entries():
             recipient=agent_id,
             payload={"prompt": "recover", "metadata": {"request_id": "pending"}},
         )
-        await client.xadd(stream, pending_message.to_redis_fields())
-
-        await client.xreadgroup(
-            groupname=group,
-            consumername="stalled-consumer",
-            streams={stream: ">"},
-            count=1,
-        )
+        # Enqueue and claim the entry for a stalled consumer in one round-trip.
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.xadd(stream, pending_message.to_redis_fields())
+            pipe.xreadgroup(
+                groupname=group,
+                consumername="stalled-consumer",
+                streams={stream: ">"},
+                count=1,
+            )
+            await pipe.execute()
 
         pending_before = await client.xpending(stream, group)
         assert pending_before["pending"] == 1
@@ -261,7 +225,7 @@ async def test_runtime_recovers_pending_entries():
         pending_after_start = await client.xpending(stream, group)
         assert pending_after_start["pending"] <= 1
 
-        await _wait_for(lambda: responses)
+        await asyncio.wait_for(response_event.wait(), timeout=5.0)
 
         assert responses[0].payload["status"] == "success"
         assert responses[0].payload["response"]["content"] == "Echo: recover"
@@ -276,5 +240,3 @@ async def test_runtime_recovers_pending_entries():
             await sender_service.stop()
         if client is not None:
             await client.aclose()
-        with suppress(Exception):
-            container.stop()